@@ -4,7 +4,7 @@ import pathlib
 import flask
 
 from foodie.blueprints import admin, auth, home, order, restaurant
-from foodie.db import db
+from foodie.db import db, init_db, init_init_db_command
 from foodie.seed import init_seed_db_command
 
 
@@ -14,15 +14,34 @@ def create_app() -> flask.Flask:
         SECRET_KEY=os.getenv("SECRET_KEY", "dev"),
         DATABASE=pathlib.Path(app.instance_path) / "foodie.sqlite",
         SQLALCHEMY_DATABASE_URI=f"sqlite:///{app.instance_path}/foodie.sqlite",
+        # Size the pool for the worker threads so requests do not wait on a
+        # connection, and make room in the statement cache for the
+        # module-level statements
+        SQLALCHEMY_ENGINE_OPTIONS={
+            "pool_size": 20,
+            "max_overflow": 40,
+            "pool_recycle": 1800,
+            "query_cache_size": 1200,
+        },
+        # Hash seeded users' passwords with a cheap method, for throwaway
+        # development and test databases only
+        SEED_FAST_HASH=os.getenv("SEED_FAST_HASH") == "1",
+        # Compile templates when the app starts. Maintenance commands such as
+        # seed-db never render one, so they can turn this off
+        PRECOMPILE_TEMPLATES=os.getenv("FOODIE_PRECOMPILE_TEMPLATES", "1") != "0",
     )
     pathlib.Path(app.instance_path).mkdir(parents=True, exist_ok=True)
 
     # Initialize database
     db.init_app(app)
-    with app.app_context():
-        db.create_all()
+
+    # Creating tables inspects the schema, so only do it on startup when asked
+    if os.getenv("FOODIE_AUTO_MIGRATE") == "1":
+        with app.app_context():
+            init_db()
 
     # Register database commands with flask cli
+    init_init_db_command(app)
     init_seed_db_command(app)
 
     # Register routes
@@ -1,16 +1,17 @@
+import itertools
+
 import flask
 
 from foodie.blueprints.auth.utils import login_required, role_required
 from foodie.blueprints.admin.services import (
-    get_dashboard_stats,
-    get_recent_orders,
+    get_dashboard_data,
+    get_orders_stream,
     get_all_payment_methods,
     get_payment_method_by_id,
     create_payment_method,
     update_payment_method,
     toggle_payment_method_status,
 )
-from foodie.blueprints.admin.utils import prepare_orders_for_template
 
 blueprint = flask.Blueprint("admin", __name__, url_prefix="/admin")
 
@@ -19,15 +20,29 @@ blueprint = flask.Blueprint("admin", __name__, url_prefix="/admin")
 @login_required
 @role_required("ADMIN")
 def dashboard() -> flask.Response:
-    stats = get_dashboard_stats()
-    recent_orders = get_recent_orders()
-    order_list = prepare_orders_for_template(recent_orders)
+    stats, recent_orders = get_dashboard_data()
 
     return flask.render_template(
-        "admin/dashboard.html", stats=stats, recent_orders=order_list
+        "admin/dashboard.html", stats=stats, recent_orders=recent_orders
     )
 
 
+@blueprint.route("/orders")
+@login_required
+@role_required("ADMIN")
+def list_orders() -> flask.Response:
+    status = flask.request.args.get("status") or None
+    orders = get_orders_stream(status)
+
+    stream = flask.stream_template("admin/orders.html", orders=orders, status=status)
+
+    # Render the first chunk before the response starts. base.html reads the
+    # flashed messages there, so they are cleared before the session is saved
+    first_chunk = next(stream)
+
+    return flask.Response(itertools.chain((first_chunk,), stream))
+
+
 @blueprint.route("/payment-methods")
 @login_required
 @role_required("ADMIN")
@@ -45,7 +60,7 @@ def add_payment_method() -> flask.Response:
     if flask.request.method == "POST":
         name = flask.request.form["name"]
         description = flask.request.form.get("description", "")
-        is_active = 1 if flask.request.form.get("is_active") else 0
+        is_active = "is_active" in flask.request.form
 
         method, error = create_payment_method(name, description, is_active)
 
@@ -71,7 +86,7 @@ def edit_payment_method(method_id: int) -> flask.Response:
     if flask.request.method == "POST":
         name = flask.request.form["name"]
         description = flask.request.form.get("description", "")
-        is_active = 1 if flask.request.form.get("is_active") else 0
+        is_active = "is_active" in flask.request.form
 
         error = update_payment_method(method_id, name, description, is_active)
 
@@ -1,51 +1,150 @@
+from collections.abc import Iterator
 from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import (
+    Row,
+    RowMapping,
+    ScalarSelect,
+    func,
+    lambda_stmt,
+    not_,
+    select,
+    update,
+)
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 
-from foodie.db import db
-from foodie.models import PaymentMethod, User, Restaurant, Order
+from foodie.cache import get_cached_dashboard_data, invalidate_payment_methods_cache
+from foodie.db import db, raiseload_options, with_raiseload
+from foodie.models import Counter, PaymentMethod, User, Restaurant, Order
+
+# Number of orders fetched per batch when streaming the admin orders view
+ORDERS_STREAM_BATCH_SIZE = 200
+
+
+def _counter_value(table_name: str) -> ScalarSelect:
+    """
+    Build a scalar subquery reading a table's row count from the counter table.
+
+    Args:
+        table_name: Name of a table in COUNTED_TABLES
+
+    Returns:
+        Scalar subquery returning the row count
+    """
+    return (
+        select(func.coalesce(func.max(Counter.value), 0))
+        .where(Counter.table_name == table_name)
+        .scalar_subquery()
+    )
+
+
+# Order statuses that count towards revenue
+_REVENUE_STATUSES = ("PLACED", "COMPLETED")
+
+# The dashboard stats query has no parameters, so it is built once at import
+_DASHBOARD_STATS_STMT = select(
+    _counter_value("user").label("total_users"),
+    _counter_value("restaurant").label("total_restaurants"),
+    _counter_value("order").label("total_orders"),
+    select(func.count(Order.id))
+    .where(Order.status == "PLACED")
+    .scalar_subquery()
+    .label("placed_orders"),
+    select(func.coalesce(func.sum(Order.total_amount), 0))
+    .where(Order.status.in_(_REVENUE_STATUSES))
+    .scalar_subquery()
+    .label("total_revenue"),
+)
 
 
 def get_dashboard_stats() -> dict[str, Any]:
     """
-    Get statistics for the admin dashboard.
+    Get statistics for the admin dashboard in a single query.
+
+    Table totals come from the trigger-maintained counter table rather than
+    COUNT(*) scans.
 
     Returns:
         Dictionary with dashboard statistics
     """
-    return {
-        "total_users": db.session.query(func.count(User.id)).scalar(),
-        "total_restaurants": db.session.query(func.count(Restaurant.id)).scalar(),
-        "total_orders": db.session.query(func.count(Order.id)).scalar(),
-        "placed_orders": db.session.query(func.count(Order.id))
-        .filter(Order.status == "PLACED")
-        .scalar(),
-        "total_revenue": db.session.query(
-            func.coalesce(func.sum(Order.total_amount), 0)
-        )
-        .filter(Order.status.in_(["PLACED", "COMPLETED"]))
-        .scalar(),
-    }
+    return dict(db.session.execute(_DASHBOARD_STATS_STMT).mappings().one())
 
 
-def get_recent_orders(limit: int = 10) -> list[tuple[Order, User, Restaurant]]:
+def get_recent_orders(limit: int = 10) -> list[RowMapping]:
     """
     Get recent orders for the admin dashboard.
 
+    Only the columns the dashboard displays are selected, so no ORM instances
+    are constructed.
+
     Args:
         limit: Maximum number of orders to return
 
     Returns:
-        List of tuples (order, user, restaurant)
+        List of row mappings with id, full_name, restaurant_name,
+        total_amount, status and created_at keys
     """
-    return (
-        db.session.query(Order, User, Restaurant)
+    stmt = lambda_stmt(
+        lambda: select(
+            Order.id,
+            User.full_name,
+            Restaurant.name.label("restaurant_name"),
+            Order.total_amount,
+            Order.status,
+            Order.created_at,
+        )
         .join(User, Order.user_id == User.id)
         .join(Restaurant, Order.restaurant_id == Restaurant.id)
         .order_by(Order.created_at.desc())
         .limit(limit)
-        .all()
+    )
+    return db.session.execute(stmt).mappings().all()
+
+
+def get_orders_stream(status: str | None = None) -> Iterator[Order]:
+    """
+    Stream all orders for the admin orders view, newest first.
+
+    Rows are fetched in batches of ORDERS_STREAM_BATCH_SIZE instead of being
+    loaded into memory at once. The query runs when iteration starts, so
+    consume it within flask.stream_with_context.
+
+    Args:
+        status: Only include orders with this status, if given
+
+    Returns:
+        Iterator of Order instances with user and restaurant loaded
+    """
+    stmt = (
+        select(Order)
+        .options(
+            joinedload(Order.user),
+            joinedload(Order.restaurant),
+            *raiseload_options(),
+        )
+        .order_by(Order.created_at.desc())
+        .execution_options(yield_per=ORDERS_STREAM_BATCH_SIZE)
+    )
+    if status is not None:
+        stmt = stmt.where(Order.status == status)
+
+    yield from db.session.execute(stmt).scalars()
+
+
+def get_dashboard_data() -> tuple[dict[str, Any], list[RowMapping]]:
+    """
+    Get the dashboard stats and recent orders, reusing a recent result.
+
+    The result is cached in-process by foodie.cache and dropped early by
+    invalidate_dashboard_cache() when orders change.
+
+    Returns:
+        Tuple of (dashboard statistics, recent orders)
+    """
+    return get_cached_dashboard_data(
+        lambda: (get_dashboard_stats(), get_recent_orders())
     )
 
 
@@ -56,7 +155,8 @@ def get_all_payment_methods() -> list[PaymentMethod]:
     Returns:
         List of PaymentMethod instances
     """
-    return db.session.query(PaymentMethod).order_by(PaymentMethod.name).all()
+    stmt = lambda_stmt(lambda: select(PaymentMethod).order_by(PaymentMethod.name))
+    return db.session.execute(with_raiseload(stmt)).scalars().all()
 
 
 def get_payment_method_by_id(method_id: int) -> PaymentMethod | None:
@@ -69,19 +169,22 @@ def get_payment_method_by_id(method_id: int) -> PaymentMethod | None:
     Returns:
         PaymentMethod instance or None
     """
-    return db.session.query(PaymentMethod).filter_by(id=method_id).first()
+    return db.session.get(PaymentMethod, method_id, options=raiseload_options())
 
 
 def create_payment_method(
-    name: str, description: str = "", is_active: int = 1
+    name: str, description: str = "", is_active: bool = True
 ) -> tuple[PaymentMethod, str | None]:
     """
     Create a new payment method.
 
+    Duplicate names are skipped by the INSERT itself rather than by catching
+    an IntegrityError.
+
     Args:
         name: Payment method name
         description: Payment method description
-        is_active: Whether the payment method is active (1 or 0)
+        is_active: Whether the payment method is active
 
     Returns:
         Tuple of (PaymentMethod instance, error message if any)
@@ -92,22 +195,24 @@ def create_payment_method(
         error = "Payment method name is required."
 
     if error is None:
-        try:
-            method = PaymentMethod(
-                name=name, description=description, is_active=is_active
-            )
-            db.session.add(method)
-            db.session.commit()
+        method = db.session.scalar(
+            sqlite.insert(PaymentMethod)
+            .values(name=name, description=description, is_active=is_active)
+            .on_conflict_do_nothing(index_elements=[PaymentMethod.name])
+            .returning(PaymentMethod)
+        )
+        db.session.commit()
+
+        if method is not None:
+            invalidate_payment_methods_cache()
             return method, None
-        except IntegrityError:
-            db.session.rollback()
-            error = f'Payment method "{name}" already exists.'
+        error = f'Payment method "{name}" already exists.'
 
     return None, error
 
 
 def update_payment_method(
-    method_id: int, name: str, description: str = "", is_active: int = 1
+    method_id: int, name: str, description: str = "", is_active: bool = True
 ) -> str | None:
     """
     Update an existing payment method.
@@ -116,7 +221,7 @@ def update_payment_method(
         method_id: Payment method ID
         name: Payment method name
         description: Payment method description
-        is_active: Whether the payment method is active (1 or 0)
+        is_active: Whether the payment method is active
 
     Returns:
         Error message if any, None otherwise
@@ -134,29 +239,40 @@ def update_payment_method(
         method.name = name
         method.description = description
         method.is_active = is_active
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            error = f'Payment method "{name}" already exists.'
+        else:
+            invalidate_payment_methods_cache()
 
     return error
 
 
 def toggle_payment_method_status(
     method_id: int,
-) -> tuple[PaymentMethod | None, str | None]:
+) -> tuple[Row | None, str | None]:
     """
-    Toggle the active status of a payment method.
+    Toggle the active status of a payment method with a single UPDATE.
 
     Args:
         method_id: Payment method ID
 
     Returns:
-        Tuple of (PaymentMethod instance or None, error message if any)
+        Tuple of (row with id, name and is_active or None, error message if any)
     """
-    method = get_payment_method_by_id(method_id)
+    method = db.session.execute(
+        update(PaymentMethod)
+        .where(PaymentMethod.id == method_id)
+        .values(is_active=not_(PaymentMethod.is_active))
+        .returning(PaymentMethod.id, PaymentMethod.name, PaymentMethod.is_active)
+    ).first()
 
     if method is None:
         return None, "Payment method not found."
 
-    method.is_active = 0 if method.is_active else 1
     db.session.commit()
+    invalidate_payment_methods_cache()
 
     return method, None
@@ -1,7 +1,7 @@
 import flask
 
 from foodie.blueprints.auth.services import authenticate_user
-from foodie.blueprints.auth.utils import load_logged_in_user
+from foodie.blueprints.auth.utils import invalidate_cached_user, load_logged_in_user
 
 blueprint = flask.Blueprint("auth", __name__, url_prefix="/auth")
 blueprint.before_app_request(load_logged_in_user)
@@ -29,6 +29,10 @@ def login() -> flask.Response:
 
 @blueprint.route("/logout")
 def logout() -> flask.Response:
+    user_id = flask.session.get("user_id")
+    if user_id is not None:
+        invalidate_cached_user(user_id)
+
     flask.session.clear()
     flask.flash("You have been logged out.", "info")
     return flask.redirect(flask.url_for("home.index"))
@@ -1,10 +1,14 @@
+from sqlalchemy import Integer, Row, String, text
 from werkzeug.security import check_password_hash
 
 from foodie.db import db
-from foodie.models import User
 
+_AUTH_STMT = text(
+    'SELECT id, password, full_name FROM "user" WHERE username = :username LIMIT 1'
+).columns(id=Integer, password=String, full_name=String)
 
-def authenticate_user(username: str, password: str) -> tuple[User | None, str | None]:
+
+def authenticate_user(username: str, password: str) -> tuple[Row | None, str | None]:
     """
     Authenticate a user with username and password.
 
@@ -13,9 +17,10 @@ def authenticate_user(username: str, password: str) -> tuple[User | None, str |
         password: Plain text password
 
     Returns:
-        Tuple of (User instance if authenticated, error message if any)
+        Tuple of (row with id, password and full_name if authenticated,
+        error message if any)
     """
-    user = db.session.query(User).filter_by(username=username).first()
+    user = db.session.execute(_AUTH_STMT, {"username": username}).first()
 
     if user is None:
         return None, "Incorrect username."
@@ -1,10 +1,71 @@
 import functools
+import time
 from typing import Callable
 
 import flask
+from sqlalchemy import Integer, Row, String, text
 
 from foodie.db import db
-from foodie.models import User
+
+# Seconds a logged-in user's row is reused before reloading it
+USER_CACHE_TTL = 30.0
+
+# Number of users cached per process before the cache is emptied
+USER_CACHE_MAX_SIZE = 1024
+
+# Columns of the logged-in user available on flask.g.user
+_USER_BY_ID_STMT = text(
+    'SELECT id, username, full_name, role, country FROM "user" WHERE id = :user_id'
+).columns(id=Integer, username=String, full_name=String, role=String, country=String)
+
+# Endpoints that never read flask.g.user, so the user is not loaded for them
+_USER_NOT_NEEDED_ENDPOINTS = frozenset({"auth.logout", "static"})
+
+_user_cache: dict[int, tuple[float, Row]] = {}
+
+
+def get_cached_user(user_id: int) -> Row | None:
+    """
+    Get a user's row by ID, reusing a recently loaded row when available.
+
+    Expired rows are dropped when found, and the cache is emptied once it
+    holds USER_CACHE_MAX_SIZE users, so it cannot grow without bound.
+
+    The row is read without the ORM, so it is not bound to a session and can
+    be shared between requests.
+
+    Requires flask app context.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Row with id, username, full_name, role and country, or None
+    """
+    entry = _user_cache.get(user_id)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            return entry[1]
+        _user_cache.pop(user_id, None)
+
+    user = db.session.execute(_USER_BY_ID_STMT, {"user_id": user_id}).first()
+    if user is not None:
+        if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+            _user_cache.clear()
+        _user_cache[user_id] = (time.monotonic() + USER_CACHE_TTL, user)
+    return user
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop a user from the logged-in user cache.
+
+    Call after logout or after changing a user's role or country.
+
+    Args:
+        user_id: User ID
+    """
+    _user_cache.pop(user_id, None)
 
 
 def load_logged_in_user() -> None:
@@ -15,10 +76,10 @@ def load_logged_in_user() -> None:
     """
     user_id = flask.session.get("user_id")
 
-    if user_id is None:
+    if user_id is None or flask.request.endpoint in _USER_NOT_NEEDED_ENDPOINTS:
         flask.g.user = None
     else:
-        flask.g.user = db.session.query(User).filter_by(id=user_id).first()
+        flask.g.user = get_cached_user(user_id)
 
 
 def login_required(view: Callable) -> Callable:
@@ -47,6 +108,7 @@ def role_required(*roles: str) -> Callable:
 
     Usage: @role_required('ADMIN') or @role_required('ADMIN', 'MANAGER')
     """
+    allowed_roles = frozenset(roles)
 
     def decorator(view: Callable) -> Callable:
         @functools.wraps(view)
@@ -55,7 +117,7 @@ def role_required(*roles: str) -> Callable:
                 flask.flash("Please log in to access this page.", "warning")
                 return flask.redirect(flask.url_for("auth.login"))
 
-            if flask.g.user.role not in roles:
+            if flask.g.user.role not in allowed_roles:
                 flask.flash("You do not have permission to access this page.", "danger")
                 return flask.redirect(flask.url_for("home.index"))
 
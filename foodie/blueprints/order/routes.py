@@ -10,77 +10,92 @@ Implements RBAC with the following permissions:
 
 import flask
 
-from foodie.db import db
-from foodie.models import Order
 from foodie.blueprints.auth.utils import (
     login_required,
     check_country_access,
     role_required,
 )
 from foodie.blueprints.order.services import (
+    ORDERS_PAGE_SIZE,
     get_orders_for_user,
-    get_order_by_id_with_relations,
-    get_order_with_restaurant,
-    get_existing_draft_order,
+    get_order_full,
+    get_edit_order_bundle,
+    get_order_with_has_items,
+    get_order_items,
+    get_existing_draft_order_id,
+    get_draft_order_restaurant_id,
+    is_draft_order,
     create_draft_order,
-    get_order_items_with_menu_items,
-    get_menu_item_with_restaurant,
+    get_menu_item_for_restaurant,
     add_item_to_order,
     remove_order_item,
-    update_order_total,
-    get_order_item_count,
     get_active_payment_methods,
-    get_payment_method_by_id,
     place_order_in_db,
     cancel_order_in_db,
+    get_order_cancel_state,
     update_order_payment_method,
     can_user_edit_order,
-    get_menu_items_for_restaurant,
 )
 from foodie.blueprints.order.utils import (
-    prepare_orders_for_list_template,
-    prepare_order_for_view_template,
-    prepare_order_for_edit_template,
-    prepare_order_for_checkout_template,
-    prepare_order_items_for_template,
+    encode_order_cursor,
+    decode_order_cursor,
 )
 
 blueprint = flask.Blueprint("order", __name__, url_prefix="/orders")
 
+# Templates rendered by the order routes
+_TEMPLATES = (
+    "order/list.html",
+    "order/view.html",
+    "order/edit.html",
+    "order/checkout.html",
+)
+
+
+@blueprint.record_once
+def compile_templates(state: flask.blueprints.BlueprintSetupState) -> None:
+    """Compile the order templates into the Jinja cache when registered."""
+    if not state.app.config["PRECOMPILE_TEMPLATES"]:
+        return
+
+    for name in _TEMPLATES:
+        state.app.jinja_env.get_template(name)
+
 
 @blueprint.route("/")
 @login_required
 def list_orders() -> flask.Response:
+    before = decode_order_cursor(flask.request.args.get("cursor"))
+
+    # Fetch one extra order to know whether there is a next page
     orders = get_orders_for_user(
-        flask.g.user.role, flask.g.user.country if flask.g.user else None
+        flask.g.user.role,
+        flask.g.user.country if flask.g.user else None,
+        before=before,
+        limit=ORDERS_PAGE_SIZE + 1,
     )
-    order_list = prepare_orders_for_list_template(orders)
 
-    return flask.render_template("order/list.html", orders=order_list)
+    next_cursor = None
+    if len(orders) > ORDERS_PAGE_SIZE:
+        orders = orders[:ORDERS_PAGE_SIZE]
+        next_cursor = encode_order_cursor(orders[-1])
+
+    return flask.render_template(
+        "order/list.html", orders=orders, next_cursor=next_cursor
+    )
 
 
 @blueprint.route("/<int:order_id>")
 @login_required
 def view_order(order_id: int) -> flask.Response:
-    result = get_order_by_id_with_relations(order_id)
+    # Orders from other countries are filtered out in SQL and look not found
+    user_country = None if flask.g.user.role == "ADMIN" else flask.g.user.country
+    order = get_order_full(order_id, user_country)
 
-    if result is None:
+    if order is None:
         flask.flash("Order not found.", "warning")
         return flask.redirect(flask.url_for("order.list_orders"))
 
-    order, user, restaurant, payment_method = result
-
-    if not check_country_access(restaurant.country):
-        flask.flash("You do not have permission to view this order.", "danger")
-        return flask.redirect(flask.url_for("order.list_orders"))
-
-    items = get_order_items_with_menu_items(order_id)
-    items_list = prepare_order_items_for_template(items)
-
-    order_dict = prepare_order_for_view_template(
-        order, user, restaurant, payment_method
-    )
-
     # Get payment methods for admin update feature
     payment_methods = None
     if flask.g.user and flask.g.user.role == "ADMIN" and order.status == "PLACED":
@@ -88,8 +103,8 @@ def view_order(order_id: int) -> flask.Response:
 
     return flask.render_template(
         "order/view.html",
-        order=order_dict,
-        items=items_list,
+        order=order,
+        items=order.order_items,
         payment_methods=payment_methods,
     )
 
@@ -111,11 +126,11 @@ def create_order(restaurant_id: int) -> flask.Response:
         )
         return flask.redirect(flask.url_for("restaurant.list_restaurants"))
 
-    existing_draft = get_existing_draft_order(flask.g.user.id, restaurant_id)
+    existing_draft_id = get_existing_draft_order_id(flask.g.user.id, restaurant_id)
 
-    if existing_draft:
+    if existing_draft_id is not None:
         return flask.redirect(
-            flask.url_for("order.edit_order", order_id=existing_draft.id)
+            flask.url_for("order.edit_order", order_id=existing_draft_id)
         )
 
     new_order = create_draft_order(flask.g.user.id, restaurant_id)
@@ -127,12 +142,12 @@ def create_order(restaurant_id: int) -> flask.Response:
 @blueprint.route("/<int:order_id>/edit")
 @login_required
 def edit_order(order_id: int) -> flask.Response:
-    result = get_order_with_restaurant(order_id)
-    if result is None:
+    bundle = get_edit_order_bundle(order_id)
+    if bundle is None:
         flask.flash("Order not found.", "danger")
         return flask.redirect(flask.url_for("order.list_orders"))
 
-    order, restaurant = result
+    order, order_items, menu_items = bundle
 
     # Check if order belongs to user and is still a draft
     if not can_user_edit_order(order, flask.g.user.id, flask.g.user.role):
@@ -143,14 +158,8 @@ def edit_order(order_id: int) -> flask.Response:
         flask.flash("This order has already been placed and cannot be edited.", "info")
         return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
 
-    items = get_order_items_with_menu_items(order_id)
-    menu_items = get_menu_items_for_restaurant(restaurant.id)
-
-    order_dict = prepare_order_for_edit_template(order, restaurant)
-    items_list = prepare_order_items_for_template(items, include_current_price=True)
-
     return flask.render_template(
-        "order/edit.html", order=order_dict, items=items_list, menu_items=menu_items
+        "order/edit.html", order=order, items=order_items, menu_items=menu_items
     )
 
 
@@ -160,25 +169,20 @@ def add_item(order_id: int) -> flask.Response:
     menu_item_id = flask.request.form.get("menu_item_id", type=int)
     quantity = flask.request.form.get("quantity", 1, type=int)
 
-    order = db.session.query(Order).filter_by(id=order_id, status="DRAFT").first()
+    restaurant_id = get_draft_order_restaurant_id(order_id)
 
-    if order is None:
+    if restaurant_id is None:
         flask.flash("Order not found or cannot be modified.", "danger")
         return flask.redirect(flask.url_for("order.list_orders"))
 
-    menu_item_result = get_menu_item_with_restaurant(menu_item_id, order.restaurant_id)
+    menu_item = get_menu_item_for_restaurant(menu_item_id, restaurant_id)
 
-    if menu_item_result is None:
+    if menu_item is None:
         flask.flash("Menu item not found.", "danger")
         return flask.redirect(flask.url_for("order.edit_order", order_id=order_id))
 
-    menu_item, restaurant = menu_item_result
-
     add_item_to_order(order_id, menu_item_id, quantity, menu_item.price)
 
-    update_order_total(db, order)
-    db.session.commit()
-
     flask.flash(f"Added {menu_item.name} to cart.", "success")
     return flask.redirect(flask.url_for("order.edit_order", order_id=order_id))
 
@@ -186,19 +190,12 @@ def add_item(order_id: int) -> flask.Response:
 @blueprint.route("/<int:order_id>/remove-item/<int:item_id>", methods=("POST",))
 @login_required
 def remove_item(order_id: int, item_id: int) -> flask.Response:
-    from foodie.models import Order
-
-    order = db.session.query(Order).filter_by(id=order_id, status="DRAFT").first()
-
-    if order is None:
+    if not is_draft_order(order_id):
         flask.flash("Order not found or cannot be modified.", "danger")
         return flask.redirect(flask.url_for("order.list_orders"))
 
     remove_order_item(item_id, order_id)
 
-    update_order_total(db, order)
-    db.session.commit()
-
     flask.flash("Item removed from cart.", "success")
     return flask.redirect(flask.url_for("order.edit_order", order_id=order_id))
 
@@ -207,21 +204,19 @@ def remove_item(order_id: int, item_id: int) -> flask.Response:
 @login_required
 @role_required("ADMIN", "MANAGER")
 def place_order(order_id: int) -> flask.Response:
-    result = get_order_with_restaurant(order_id)
+    result = get_order_with_has_items(order_id)
 
     if result is None:
         flask.flash("Order not found.", "danger")
         return flask.redirect(flask.url_for("order.list_orders"))
 
-    order, restaurant = result
+    order, has_items = result
 
     if order.status != "DRAFT":
         flask.flash("This order has already been placed.", "info")
         return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
 
-    item_count = get_order_item_count(order_id)
-
-    if item_count == 0:
+    if not has_items:
         flask.flash("Cannot place an empty order. Please add items first.", "danger")
         return flask.redirect(flask.url_for("order.edit_order", order_id=order_id))
 
@@ -232,29 +227,23 @@ def place_order(order_id: int) -> flask.Response:
             flask.flash("Please select a payment method.", "danger")
             return flask.redirect(flask.url_for("order.place_order", order_id=order_id))
 
-        # Verify payment method exists and is active
-        payment_method = get_payment_method_by_id(payment_method_id)
-
-        if payment_method is None:
+        # The payment method must exist and be active for the order to be placed
+        if not place_order_in_db(order_id, payment_method_id):
             flask.flash("Invalid payment method.", "danger")
             return flask.redirect(flask.url_for("order.place_order", order_id=order_id))
 
-        place_order_in_db(order_id, payment_method_id)
-
         flask.flash("Order placed successfully!", "success")
         return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
 
     # GET request - show checkout page
     payment_methods = get_active_payment_methods()
-    items = get_order_items_with_menu_items(order_id)
 
-    order_dict = prepare_order_for_checkout_template(order, restaurant)
-    items_list = prepare_order_items_for_template(items)
+    order_items = get_order_items(order_id)
 
     return flask.render_template(
         "order/checkout.html",
-        order=order_dict,
-        items=items_list,
+        order=order,
+        items=order_items,
         payment_methods=payment_methods,
     )
 
@@ -263,29 +252,27 @@ def place_order(order_id: int) -> flask.Response:
 @login_required
 @role_required("ADMIN", "MANAGER")
 def cancel_order(order_id: int) -> flask.Response:
-    result = get_order_by_id_with_relations(order_id)
+    user_country = None if flask.g.user.role == "ADMIN" else flask.g.user.country
 
-    if result is None:
+    if cancel_order_in_db(order_id, user_country):
+        flask.flash("Order cancelled successfully.", "success")
+        return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
+
+    # Nothing was cancelled, look up the order to tell the user why
+    order = get_order_cancel_state(order_id)
+
+    if order is None:
         flask.flash("Order not found.", "danger")
         return flask.redirect(flask.url_for("order.list_orders"))
 
-    order, user, restaurant, payment_method = result
-
-    if not check_country_access(user.country):
+    if not check_country_access(order.country):
         flask.flash("You do not have permission to cancel this order.", "danger")
         return flask.redirect(flask.url_for("order.list_orders"))
 
     if order.status == "CANCELLED":
         flask.flash("This order is already cancelled.", "info")
-        return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
-
-    if order.status == "COMPLETED":
+    else:
         flask.flash("Cannot cancel a completed order.", "danger")
-        return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
-
-    cancel_order_in_db(order_id)
-
-    flask.flash("Order cancelled successfully.", "success")
     return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
 
 
@@ -295,20 +282,10 @@ def cancel_order(order_id: int) -> flask.Response:
 def update_payment_method(order_id: int) -> flask.Response:
     payment_method_id = flask.request.form.get("payment_method_id", type=int)
 
-    order = db.session.query(Order).filter_by(id=order_id).first()
-
-    if order is None:
-        flask.flash("Order not found.", "danger")
-        return flask.redirect(flask.url_for("order.list_orders"))
-
-    # Verify payment method exists and is active
-    payment_method = get_payment_method_by_id(payment_method_id)
-
-    if payment_method is None:
-        flask.flash("Invalid payment method.", "danger")
+    # The payment method must exist and be active for the order to be updated
+    if not update_order_payment_method(order_id, payment_method_id):
+        flask.flash("Order not found or invalid payment method.", "danger")
         return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
 
-    update_order_payment_method(order_id, payment_method_id)
-
     flask.flash("Payment method updated successfully.", "success")
     return flask.redirect(flask.url_for("order.view_order", order_id=order_id))
@@ -1,9 +1,23 @@
 import datetime
 
-import flask_sqlalchemy
-from sqlalchemy import func
+from sqlalchemy import (
+    Row,
+    RowMapping,
+    and_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from foodie.db import db
+from foodie.cache import get_cached_payment_methods, invalidate_dashboard_cache
+from foodie.db import db, with_raiseload
 from foodie.models import (
     Order,
     Restaurant,
@@ -13,187 +27,422 @@ from foodie.models import (
     PaymentMethod,
 )
 
+# Number of orders shown per page of the orders list
+ORDERS_PAGE_SIZE = 50
+
+# Statements for the hot read paths are built once at import and reused, so
+# each request only binds parameters. Parameters are named with bindparam().
+
+_ORDERS_STMT = (
+    select(
+        Order.id,
+        Order.user_id,
+        User.username,
+        User.full_name,
+        Restaurant.name.label("restaurant_name"),
+        Restaurant.country.label("restaurant_country"),
+        Order.total_amount,
+        Order.status,
+        PaymentMethod.name.label("payment_method_name"),
+        Order.created_at,
+    )
+    .join(User, Order.user_id == User.id)
+    .join(Restaurant, Order.restaurant_id == Restaurant.id)
+    .outerjoin(PaymentMethod, Order.payment_method_id == PaymentMethod.id)
+    .order_by(Order.created_at.desc(), Order.id.desc())
+    .limit(bindparam("limit"))
+)
+
+_ORDERS_FOR_COUNTRY_STMT = _ORDERS_STMT.where(
+    Restaurant.country == bindparam("country")
+)
+
+_ORDER_FULL_STMT = (
+    select(Order)
+    .where(Order.id == bindparam("order_id"))
+    .options(
+        joinedload(Order.user).load_only(User.full_name, User.country),
+        joinedload(Order.restaurant).load_only(Restaurant.name, Restaurant.country),
+        joinedload(Order.payment_method).load_only(PaymentMethod.name),
+        selectinload(Order.order_items)
+        .joinedload(OrderItem.menu_item)
+        .load_only(MenuItem.name),
+    )
+)
+
+_ORDER_FULL_FOR_COUNTRY_STMT = _ORDER_FULL_STMT.where(
+    exists().where(
+        Restaurant.id == Order.restaurant_id,
+        Restaurant.country == bindparam("country"),
+    )
+)
+
+_ORDER_WITH_HAS_ITEMS_STMT = (
+    select(
+        Order,
+        exists()
+        .where(OrderItem.order_id == Order.id)
+        .correlate(Order)
+        .label("has_items"),
+    )
+    .where(Order.id == bindparam("order_id"))
+    .options(joinedload(Order.restaurant))
+)
+
+_ORDER_ITEMS_STMT = (
+    select(OrderItem)
+    .where(OrderItem.order_id == bindparam("order_id"))
+    .options(joinedload(OrderItem.menu_item))
+)
+
+_ORDER_WITH_RESTAURANT_STMT = (
+    select(Order)
+    .where(Order.id == bindparam("order_id"))
+    .options(joinedload(Order.restaurant))
+)
+
+# Every menu item of the order's restaurant, paired with the order's item for
+# it if there is one. Items can only be added from the order's restaurant, so
+# this covers all of the order's items.
+_MENU_ITEMS_WITH_ORDER_ITEMS_STMT = (
+    select(MenuItem, OrderItem)
+    .outerjoin(
+        OrderItem,
+        and_(
+            OrderItem.menu_item_id == MenuItem.id,
+            OrderItem.order_id == bindparam("order_id"),
+        ),
+    )
+    .where(
+        MenuItem.restaurant_id
+        == select(Order.restaurant_id)
+        .where(Order.id == bindparam("order_id"))
+        .scalar_subquery()
+    )
+    .order_by(MenuItem.name)
+)
+
+_DRAFT_ORDER_ID_STMT = (
+    select(Order.id)
+    .where(
+        Order.user_id == bindparam("user_id"),
+        Order.restaurant_id == bindparam("restaurant_id"),
+        Order.status == "DRAFT",
+    )
+    .limit(1)
+)
+
+_DRAFT_ORDER_RESTAURANT_ID_STMT = select(Order.restaurant_id).where(
+    Order.id == bindparam("order_id"), Order.status == "DRAFT"
+)
+
+_IS_DRAFT_ORDER_STMT = select(
+    exists().where(Order.id == bindparam("order_id"), Order.status == "DRAFT")
+)
+
+_MENU_ITEM_STMT = select(MenuItem.name, MenuItem.price).where(
+    MenuItem.id == bindparam("menu_item_id"),
+    MenuItem.restaurant_id == bindparam("restaurant_id"),
+)
+
+_ACTIVE_PAYMENT_METHODS_STMT = (
+    select(PaymentMethod.id, PaymentMethod.name, PaymentMethod.description)
+    .where(PaymentMethod.is_active.is_(True))
+    .order_by(PaymentMethod.name)
+)
+
+_ORDER_CANCEL_STATE_STMT = (
+    select(Order.status, User.country)
+    .join(User, Order.user_id == User.id)
+    .where(Order.id == bindparam("order_id"))
+)
+
+# Write statements. Nothing they change is held in the session, so the ORM
+# is told not to synchronize it.
+
+_ADD_ITEM_STMT = sqlite.insert(OrderItem)
+_ADD_ITEM_STMT = _ADD_ITEM_STMT.on_conflict_do_update(
+    index_elements=[OrderItem.order_id, OrderItem.menu_item_id],
+    set_={
+        "quantity": OrderItem.quantity + _ADD_ITEM_STMT.excluded.quantity,
+        "subtotal": (OrderItem.quantity + _ADD_ITEM_STMT.excluded.quantity)
+        * _ADD_ITEM_STMT.excluded.unit_price,
+    },
+)
+
+_REMOVE_ITEM_STMT = (
+    delete(OrderItem)
+    .where(
+        OrderItem.id == bindparam("item_id"),
+        OrderItem.order_id == bindparam("order_id"),
+    )
+    .execution_options(synchronize_session=False)
+)
+
+_ACTIVE_PAYMENT_METHOD_EXISTS = exists().where(
+    PaymentMethod.id == bindparam("method_id"),
+    PaymentMethod.is_active.is_(True),
+)
+
+_PLACE_ORDER_STMT = (
+    update(Order)
+    .where(
+        Order.id == bindparam("order_id"),
+        Order.status == "DRAFT",
+        _ACTIVE_PAYMENT_METHOD_EXISTS,
+    )
+    .values(
+        status="PLACED",
+        payment_method_id=bindparam("method_id"),
+        placed_at=func.now(),
+    )
+    .execution_options(synchronize_session=False)
+)
+
+_CANCEL_ORDER_STMT = (
+    update(Order)
+    .where(
+        Order.id == bindparam("order_id"),
+        Order.status.not_in(("CANCELLED", "COMPLETED")),
+    )
+    .values(status="CANCELLED", cancelled_at=func.now())
+    .execution_options(synchronize_session=False)
+)
+
+_CANCEL_ORDER_FOR_COUNTRY_STMT = _CANCEL_ORDER_STMT.where(
+    exists().where(User.id == Order.user_id, User.country == bindparam("country"))
+)
+
+_UPDATE_PAYMENT_METHOD_STMT = (
+    update(Order)
+    .where(Order.id == bindparam("order_id"), _ACTIVE_PAYMENT_METHOD_EXISTS)
+    .values(payment_method_id=bindparam("method_id"))
+    .execution_options(synchronize_session=False)
+)
+
 
 def get_orders_for_user(
-    user_role: str, user_country: str | None = None
-) -> list[tuple[Order, User, Restaurant, PaymentMethod]]:
+    user_role: str,
+    user_country: str | None = None,
+    before: tuple[datetime.datetime, int] | None = None,
+    limit: int = ORDERS_PAGE_SIZE,
+) -> list[RowMapping]:
     """
-    Get orders accessible to the user based on their role and country.
+    Get a page of orders accessible to the user based on their role and country.
+
+    Orders are paged by (created_at, id) keyset rather than OFFSET, so each
+    page is an index range scan no matter how deep it is.
+
+    Only the columns the orders list displays are selected, so no ORM
+    instances are constructed.
 
     Args:
         user_role: User's role (ADMIN, MANAGER, MEMBER)
         user_country: User's country (required for non-admin users)
+        before: (created_at, id) of the last order on the previous page
+        limit: Maximum number of orders to return
 
     Returns:
-        List of tuples (order, user, restaurant, payment_method)
+        List of row mappings with id, user_id, username, full_name,
+        restaurant_name, restaurant_country, total_amount, status,
+        payment_method_name and created_at keys
     """
-    base_query = (
-        db.session.query(Order, User, Restaurant, PaymentMethod)
-        .join(User, Order.user_id == User.id)
-        .join(Restaurant, Order.restaurant_id == Restaurant.id)
-        .outerjoin(PaymentMethod, Order.payment_method_id == PaymentMethod.id)
-    )
-
     if user_role == "ADMIN":
         # Admin can see all orders
-        return base_query.order_by(Order.created_at.desc()).all()
+        stmt, params = _ORDERS_STMT, {"limit": limit}
     else:
         # Managers and Members can only see orders from their country
-        return (
-            base_query.filter(Restaurant.country == user_country)
-            .order_by(Order.created_at.desc())
-            .all()
-        )
+        stmt = _ORDERS_FOR_COUNTRY_STMT
+        params = {"country": user_country, "limit": limit}
 
+    if before is not None:
+        stmt = stmt.where(tuple_(Order.created_at, Order.id) < tuple_(*before))
 
-def get_order_by_id_with_relations(
-    order_id: int,
-) -> tuple[Order, User, Restaurant, PaymentMethod] | None:
+    return db.session.execute(stmt, params).mappings().all()
+
+
+def get_order_full(order_id: int, user_country: str | None = None) -> Order | None:
     """
-    Get an order by ID with related user, restaurant, and payment method.
+    Get an order by ID with its user, restaurant, payment method and items.
+
+    When a country is given, orders from restaurants in other countries are
+    filtered out by the query itself, so they are reported as not found.
+
+    Single-valued relationships are joined into the order row and the items,
+    with their menu items, are loaded by one additional batched query. Only
+    the related columns the order view displays are loaded.
 
     Args:
         order_id: Order ID
+        user_country: Country the order's restaurant must be in (None for admins)
 
     Returns:
-        Tuple (order, user, restaurant, payment_method) or None
+        Order instance with relationships loaded, or None
     """
-    return (
-        db.session.query(Order, User, Restaurant, PaymentMethod)
-        .join(User, Order.user_id == User.id)
-        .join(Restaurant, Order.restaurant_id == Restaurant.id)
-        .outerjoin(PaymentMethod, Order.payment_method_id == PaymentMethod.id)
-        .filter(Order.id == order_id)
-        .first()
-    )
+    if user_country is None:
+        stmt, params = _ORDER_FULL_STMT, {"order_id": order_id}
+    else:
+        stmt = _ORDER_FULL_FOR_COUNTRY_STMT
+        params = {"order_id": order_id, "country": user_country}
+
+    return db.session.execute(with_raiseload(stmt), params).scalar_one_or_none()
 
 
-def get_order_by_id(order_id: int) -> Order | None:
+def get_order_with_has_items(order_id: int) -> tuple[Order, bool] | None:
     """
-    Get an order by ID.
+    Get an order with its restaurant and whether the order has any items.
+
+    The check is a correlated EXISTS, so both come from one query and the
+    order's items are not counted.
 
     Args:
         order_id: Order ID
 
     Returns:
-        Order instance or None
+        Tuple (order, has_items) or None
     """
-    return db.session.query(Order).filter_by(id=order_id).first()
+    return db.session.execute(
+        with_raiseload(_ORDER_WITH_HAS_ITEMS_STMT), {"order_id": order_id}
+    ).first()
 
 
-def get_order_with_restaurant(order_id: int) -> tuple[Order, Restaurant] | None:
+def get_order_items(order_id: int) -> list[OrderItem]:
     """
-    Get an order with its restaurant.
+    Get the items of an order with their menu items.
 
     Args:
         order_id: Order ID
 
     Returns:
-        Tuple (order, restaurant) or None
+        List of OrderItem instances with menu_item loaded
     """
     return (
-        db.session.query(Order, Restaurant)
-        .join(Restaurant, Order.restaurant_id == Restaurant.id)
-        .filter(Order.id == order_id)
-        .first()
+        db.session.execute(with_raiseload(_ORDER_ITEMS_STMT), {"order_id": order_id})
+        .scalars()
+        .all()
     )
 
 
-def get_existing_draft_order(user_id: int, restaurant_id: int) -> Order | None:
+def get_edit_order_bundle(
+    order_id: int,
+) -> tuple[Order, list[OrderItem], list[MenuItem]] | None:
     """
-    Get an existing draft order for a user and restaurant.
+    Get everything the edit order page needs.
+
+    The menu items of the order's restaurant and the order's items are loaded
+    together by one LEFT JOIN, and each order item's menu_item is set from the
+    joined row so no further query is needed.
 
     Args:
-        user_id: User ID
-        restaurant_id: Restaurant ID
+        order_id: Order ID
 
     Returns:
-        Order instance or None
+        Tuple (Order with restaurant loaded, order items with menu_item loaded,
+        menu items ordered by name), or None if the order does not exist
     """
-    return (
-        db.session.query(Order)
-        .filter_by(user_id=user_id, restaurant_id=restaurant_id, status="DRAFT")
-        .first()
-    )
+    order = db.session.execute(
+        with_raiseload(_ORDER_WITH_RESTAURANT_STMT), {"order_id": order_id}
+    ).scalar_one_or_none()
+    if order is None:
+        return None
 
+    rows = db.session.execute(
+        with_raiseload(_MENU_ITEMS_WITH_ORDER_ITEMS_STMT), {"order_id": order_id}
+    ).all()
 
-def create_draft_order(user_id: int, restaurant_id: int) -> Order:
+    menu_items = []
+    order_items = []
+    for menu_item, order_item in rows:
+        menu_items.append(menu_item)
+        if order_item is not None:
+            set_committed_value(order_item, "menu_item", menu_item)
+            order_items.append(order_item)
+
+    return order, order_items, menu_items
+
+
+def get_existing_draft_order_id(user_id: int, restaurant_id: int) -> int | None:
     """
-    Create a new draft order.
+    Get the ID of an existing draft order for a user and restaurant.
 
     Args:
         user_id: User ID
         restaurant_id: Restaurant ID
 
     Returns:
-        Created Order instance
+        Order ID or None
     """
-    new_order = Order(
-        user_id=user_id,
-        restaurant_id=restaurant_id,
-        status="DRAFT",
-        total_amount=0.0,
-    )
-    db.session.add(new_order)
-    db.session.commit()
-    return new_order
+    return db.session.execute(
+        _DRAFT_ORDER_ID_STMT, {"user_id": user_id, "restaurant_id": restaurant_id}
+    ).scalar()
 
 
-def get_order_items_with_menu_items(order_id: int) -> list[tuple[OrderItem, MenuItem]]:
+def get_draft_order_restaurant_id(order_id: int) -> int | None:
     """
-    Get order items with their menu items.
+    Get the restaurant ID of an order that is still a draft.
 
     Args:
         order_id: Order ID
 
     Returns:
-        List of tuples (order_item, menu_item)
+        Restaurant ID, or None if the order does not exist or is not a draft
     """
-    return (
-        db.session.query(OrderItem, MenuItem)
-        .join(MenuItem, OrderItem.menu_item_id == MenuItem.id)
-        .filter(OrderItem.order_id == order_id)
-        .all()
-    )
+    return db.session.execute(
+        _DRAFT_ORDER_RESTAURANT_ID_STMT, {"order_id": order_id}
+    ).scalar()
 
 
-def get_menu_item_with_restaurant(
-    menu_item_id: int, restaurant_id: int
-) -> tuple[MenuItem, Restaurant] | None:
+def is_draft_order(order_id: int) -> bool:
     """
-    Get a menu item with its restaurant, verifying it belongs to the restaurant.
+    Check whether an order exists and is still a draft.
 
     Args:
-        menu_item_id: Menu item ID
+        order_id: Order ID
+
+    Returns:
+        True if the order is a draft, False otherwise
+    """
+    return db.session.execute(_IS_DRAFT_ORDER_STMT, {"order_id": order_id}).scalar()
+
+
+def create_draft_order(user_id: int, restaurant_id: int) -> Order:
+    """
+    Create a new draft order.
+
+    Args:
+        user_id: User ID
         restaurant_id: Restaurant ID
 
     Returns:
-        Tuple (menu_item, restaurant) or None
+        Created Order instance
     """
-    return (
-        db.session.query(MenuItem, Restaurant)
-        .join(Restaurant, MenuItem.restaurant_id == Restaurant.id)
-        .filter(MenuItem.id == menu_item_id, MenuItem.restaurant_id == restaurant_id)
-        .first()
+    new_order = Order(
+        user_id=user_id,
+        restaurant_id=restaurant_id,
+        status="DRAFT",
+        total_amount=0.0,
     )
+    db.session.add(new_order)
+    db.session.commit()
+    invalidate_dashboard_cache()
+    return new_order
 
 
-def get_existing_order_item(order_id: int, menu_item_id: int) -> OrderItem | None:
+def get_menu_item_for_restaurant(menu_item_id: int, restaurant_id: int) -> Row | None:
     """
-    Get an existing order item if it exists.
+    Get the name and price of a menu item, verifying it belongs to the restaurant.
 
     Args:
-        order_id: Order ID
         menu_item_id: Menu item ID
+        restaurant_id: Restaurant ID
 
     Returns:
-        OrderItem instance or None
+        Row with name and price, or None
     """
-    return (
-        db.session.query(OrderItem)
-        .filter_by(order_id=order_id, menu_item_id=menu_item_id)
-        .first()
-    )
+    return db.session.execute(
+        _MENU_ITEM_STMT,
+        {"menu_item_id": menu_item_id, "restaurant_id": restaurant_id},
+    ).first()
 
 
 def add_item_to_order(
@@ -202,31 +451,31 @@ def add_item_to_order(
     """
     Add an item to an order or update quantity if it already exists.
 
+    Both cases are handled by a single INSERT ... ON CONFLICT DO UPDATE.
+
     Args:
         order_id: Order ID
         menu_item_id: Menu item ID
         quantity: Quantity to add
         unit_price: Unit price
     """
-    existing_item = get_existing_order_item(order_id, menu_item_id)
-
-    if existing_item:
-        existing_item.quantity += quantity
-        existing_item.subtotal = existing_item.quantity * unit_price
-    else:
-        new_item = OrderItem(
-            order_id=order_id,
-            menu_item_id=menu_item_id,
-            quantity=quantity,
-            unit_price=unit_price,
-            subtotal=quantity * unit_price,
-        )
-        db.session.add(new_item)
+    db.session.execute(
+        _ADD_ITEM_STMT,
+        {
+            "order_id": order_id,
+            "menu_item_id": menu_item_id,
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "subtotal": quantity * unit_price,
+        },
+    )
+    db.session.commit()
+    invalidate_dashboard_cache()
 
 
 def remove_order_item(item_id: int, order_id: int) -> bool:
     """
-    Remove an order item.
+    Remove an order item with a single DELETE.
 
     Args:
         item_id: Order item ID
@@ -235,116 +484,131 @@ def remove_order_item(item_id: int, order_id: int) -> bool:
     Returns:
         True if item was found and removed, False otherwise
     """
-    item = db.session.query(OrderItem).filter_by(id=item_id, order_id=order_id).first()
-    if item:
-        db.session.delete(item)
-        return True
-    return False
-
+    result = db.session.execute(
+        _REMOVE_ITEM_STMT, {"item_id": item_id, "order_id": order_id}
+    )
+    db.session.commit()
 
-def update_order_total(db: flask_sqlalchemy.SQLAlchemy, order: Order) -> None:
-    """
-    Update the total amount of an order based on its items.
+    if result.rowcount == 0:
+        return False
 
-    Args:
-        db: SQLAlchemy database instance
-        order: Order instance
-    """
-    total = (
-        db.session.query(func.coalesce(func.sum(OrderItem.subtotal), 0))
-        .filter_by(order_id=order.id)
-        .scalar()
-    )
-    order.total_amount = total
+    invalidate_dashboard_cache()
+    return True
 
 
-def get_order_item_count(order_id: int) -> int:
+def place_order_in_db(order_id: int, payment_method_id: int) -> bool:
     """
-    Get the count of items in an order.
+    Place an order (change status from DRAFT to PLACED).
+
+    The order is only updated if it is still a draft and the payment method
+    exists and is active, checked by the UPDATE itself.
 
     Args:
         order_id: Order ID
+        payment_method_id: Payment method ID
 
     Returns:
-        Number of items in the order
+        True if the order was placed, False otherwise
     """
-    return (
-        db.session.query(func.count(OrderItem.id)).filter_by(order_id=order_id).scalar()
+    result = db.session.execute(
+        _PLACE_ORDER_STMT, {"order_id": order_id, "method_id": payment_method_id}
     )
+    db.session.commit()
 
+    if result.rowcount == 0:
+        return False
 
-def get_active_payment_methods() -> list[PaymentMethod]:
-    """
-    Get all active payment methods ordered by name.
-
-    Returns:
-        List of PaymentMethod instances
-    """
-    return (
-        db.session.query(PaymentMethod)
-        .filter_by(is_active=1)
-        .order_by(PaymentMethod.name)
-        .all()
-    )
+    invalidate_dashboard_cache()
+    return True
 
 
-def get_payment_method_by_id(payment_method_id: int) -> PaymentMethod | None:
+def cancel_order_in_db(order_id: int, user_country: str | None = None) -> bool:
     """
-    Get an active payment method by ID.
+    Cancel an order.
+
+    The order is only updated if it is not already cancelled or completed and,
+    when a country is given, belongs to a user from that country. Both are
+    checked by the UPDATE itself so concurrent cancels cannot race.
 
     Args:
-        payment_method_id: Payment method ID
+        order_id: Order ID
+        user_country: Country the order's user must be from (None for admins)
 
     Returns:
-        PaymentMethod instance or None
+        True if the order was cancelled, False otherwise
     """
-    return (
-        db.session.query(PaymentMethod)
-        .filter_by(id=payment_method_id, is_active=1)
-        .first()
-    )
+    if user_country is None:
+        stmt, params = _CANCEL_ORDER_STMT, {"order_id": order_id}
+    else:
+        stmt = _CANCEL_ORDER_FOR_COUNTRY_STMT
+        params = {"order_id": order_id, "country": user_country}
 
+    result = db.session.execute(stmt, params)
+    db.session.commit()
 
-def place_order_in_db(order_id: int, payment_method_id: int) -> None:
+    if result.rowcount == 0:
+        return False
+
+    invalidate_dashboard_cache()
+    return True
+
+
+def get_order_cancel_state(order_id: int) -> Row | None:
     """
-    Place an order (change status from DRAFT to PLACED).
+    Get the status of an order and the country of its user.
+
+    Used to explain why cancel_order_in_db did not cancel an order.
 
     Args:
         order_id: Order ID
-        payment_method_id: Payment method ID
+
+    Returns:
+        Row with status and country, or None if the order does not exist
     """
-    order = get_order_by_id(order_id)
-    order.status = "PLACED"
-    order.payment_method_id = payment_method_id
-    order.placed_at = datetime.datetime.now(datetime.timezone.utc)
-    db.session.commit()
+    return db.session.execute(_ORDER_CANCEL_STATE_STMT, {"order_id": order_id}).first()
 
 
-def cancel_order_in_db(order_id: int) -> None:
+def get_active_payment_methods() -> list[RowMapping]:
     """
-    Cancel an order.
+    Get all active payment methods ordered by name.
 
-    Args:
-        order_id: Order ID
+    The result is cached in-process by foodie.cache and dropped early by
+    invalidate_payment_methods_cache() when a payment method is changed.
+
+    Returns:
+        List of row mappings with id, name and description keys
     """
-    order = get_order_by_id(order_id)
-    order.status = "CANCELLED"
-    order.cancelled_at = datetime.datetime.now(datetime.timezone.utc)
-    db.session.commit()
+    return get_cached_payment_methods(
+        lambda: db.session.execute(_ACTIVE_PAYMENT_METHODS_STMT).mappings().all()
+    )
 
 
-def update_order_payment_method(order_id: int, payment_method_id: int) -> None:
+def update_order_payment_method(order_id: int, payment_method_id: int) -> bool:
     """
     Update the payment method for a placed order.
 
+    The order is only updated if the payment method exists and is active,
+    checked by the UPDATE itself.
+
     Args:
         order_id: Order ID
         payment_method_id: Payment method ID
+
+    Returns:
+        True if the order was updated, False otherwise
     """
-    order = get_order_by_id(order_id)
-    order.payment_method_id = payment_method_id
+    result = db.session.execute(
+        _UPDATE_PAYMENT_METHOD_STMT,
+        {"order_id": order_id, "method_id": payment_method_id},
+    )
     db.session.commit()
 
+    if result.rowcount == 0:
+        return False
+
+    invalidate_dashboard_cache()
+    return True
+
 
 def can_user_edit_order(order: Order, user_id: int, user_role: str) -> bool:
     """
@@ -365,21 +629,3 @@ def can_user_edit_order(order: Order, user_id: int, user_role: str) -> bool:
     if user_role in ("ADMIN", "MANAGER"):
         return True
     return False
-
-
-def get_menu_items_for_restaurant(restaurant_id: int) -> list[MenuItem]:
-    """
-    Get menu items for a restaurant.
-
-    Args:
-        restaurant_id: Restaurant ID
-
-    Returns:
-        List of MenuItem instances
-    """
-    return (
-        db.session.query(MenuItem)
-        .filter_by(restaurant_id=restaurant_id)
-        .order_by(MenuItem.name)
-        .all()
-    )
@@ -1,12 +1,16 @@
 import flask
 
-from foodie.blueprints.auth.utils import login_required, check_country_access
+from foodie.blueprints.auth.utils import login_required
 from foodie.blueprints.restaurant.services import (
+    RESTAURANTS_PAGE_SIZE,
     get_restaurants_for_user,
-    get_restaurant_by_id,
+    get_restaurant_for_user,
     get_menu_items_for_restaurant,
 )
-from foodie.blueprints.restaurant.utils import prepare_restaurants_for_template
+from foodie.blueprints.restaurant.utils import (
+    encode_restaurant_cursor,
+    decode_restaurant_cursor,
+)
 
 blueprint = flask.Blueprint("restaurant", __name__, url_prefix="/restaurants")
 
@@ -14,28 +18,37 @@ blueprint = flask.Blueprint("restaurant", __name__, url_prefix="/restaurants")
 @blueprint.route("/")
 @login_required
 def list_restaurants() -> flask.Response:
+    after = decode_restaurant_cursor(flask.request.args.get("cursor"))
+
+    # Fetch one extra restaurant to know whether there is a next page
     restaurants = get_restaurants_for_user(
-        flask.g.user.role, flask.g.user.country if flask.g.user else None
+        flask.g.user.role,
+        flask.g.user.country if flask.g.user else None,
+        after=after,
+        limit=RESTAURANTS_PAGE_SIZE + 1,
     )
-    restaurant_list = prepare_restaurants_for_template(restaurants)
 
-    return flask.render_template("restaurant/list.html", restaurants=restaurant_list)
+    next_cursor = None
+    if len(restaurants) > RESTAURANTS_PAGE_SIZE:
+        restaurants = restaurants[:RESTAURANTS_PAGE_SIZE]
+        next_cursor = encode_restaurant_cursor(restaurants[-1])
+
+    return flask.render_template(
+        "restaurant/list.html", restaurants=restaurants, next_cursor=next_cursor
+    )
 
 
 @blueprint.route("/<int:restaurant_id>")
 @login_required
 def view_restaurant(restaurant_id: int) -> flask.Response:
-    restaurant = get_restaurant_by_id(restaurant_id)
+    # Restaurants in other countries are filtered out in SQL and look not found
+    user_country = None if flask.g.user.role == "ADMIN" else flask.g.user.country
+    restaurant = get_restaurant_for_user(restaurant_id, user_country)
 
     if restaurant is None:
         flask.flash("Restaurant not found.", "danger")
         return flask.redirect(flask.url_for("restaurant.list_restaurants"))
 
-    # Check if user has access to this restaurant's country
-    if not check_country_access(restaurant.country):
-        flask.flash("You do not have permission to view this restaurant.", "danger")
-        return flask.redirect(flask.url_for("restaurant.list_restaurants"))
-
     menu_items = get_menu_items_for_restaurant(restaurant_id)
 
     return flask.render_template(
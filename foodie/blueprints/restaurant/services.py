@@ -1,49 +1,94 @@
-from sqlalchemy import func
+from sqlalchemy import RowMapping, bindparam, func, select, tuple_
+from sqlalchemy.orm import undefer_group
 
-from foodie.db import db
+from foodie.db import db, raiseload_options, with_raiseload
 from foodie.models import Restaurant, MenuItem
 
+# Number of restaurants shown per page of the restaurant list
+RESTAURANTS_PAGE_SIZE = 50
+
+# Statements for the hot read paths are built once at import and reused, so
+# each request only binds parameters. Parameters are named with bindparam().
+
+_RESTAURANT_DETAILS_STMT = (
+    select(Restaurant)
+    .where(Restaurant.id == bindparam("restaurant_id"))
+    .options(undefer_group("details"))
+)
+
+_RESTAURANT_DETAILS_FOR_COUNTRY_STMT = _RESTAURANT_DETAILS_STMT.where(
+    Restaurant.country == bindparam("country")
+)
+
+_MENU_ITEMS_STMT = (
+    select(MenuItem)
+    .where(MenuItem.restaurant_id == bindparam("restaurant_id"))
+    .order_by(MenuItem.name)
+)
+
 
 def get_restaurants_for_user(
     user_role: str,
     user_country: str | None = None,
-) -> list[tuple[Restaurant, int]]:
+    after: tuple[str, str, int] | None = None,
+    limit: int = RESTAURANTS_PAGE_SIZE,
+) -> list[RowMapping]:
     """
-    Get restaurants accessible to the user based on their role and country.
+    Get a page of restaurants accessible to the user based on their role and
+    country.
+
+    Restaurants are paged by (country, name, id) keyset rather than OFFSET,
+    which ix_restaurant_country_name serves as an index range scan.
+
+    Only the columns the restaurant list displays are selected, so no ORM
+    instances are constructed.
+
+    Menu items are counted per restaurant by a correlated subquery, which is
+    an index lookup on menu_item.restaurant_id, instead of a join and GROUP BY.
 
     Args:
         user_role: User's role (ADMIN, MANAGER, MEMBER)
         user_country: User's country (required for non-admin users)
+        after: (country, name, id) of the last restaurant on the previous page
+        limit: Maximum number of restaurants to return
 
     Returns:
-        List of tuples (restaurant, menu_count)
+        List of row mappings with id, name, description, country, address,
+        phone and menu_count keys
     """
-    if user_role == "ADMIN":
-        # Admin can see all restaurants
-        return (
-            db.session.query(
-                Restaurant,
-                func.count(MenuItem.id).label("menu_count"),
-            )
-            .outerjoin(MenuItem, (Restaurant.id == MenuItem.restaurant_id))
-            .group_by(Restaurant.id)
-            .order_by(Restaurant.country, Restaurant.name)
-            .all()
+    menu_count = (
+        select(func.count(MenuItem.id))
+        .where(MenuItem.restaurant_id == Restaurant.id)
+        .correlate(Restaurant)
+        .scalar_subquery()
+        .label("menu_count")
+    )
+
+    stmt = (
+        select(
+            Restaurant.id,
+            Restaurant.name,
+            Restaurant.description,
+            Restaurant.country,
+            Restaurant.address,
+            Restaurant.phone,
+            menu_count,
         )
-    else:
+        .order_by(Restaurant.country, Restaurant.name, Restaurant.id)
+        .limit(limit)
+    )
+
+    if user_role != "ADMIN":
         # Managers and Members can only see restaurants in their country
-        return (
-            db.session.query(
-                Restaurant,
-                func.count(MenuItem.id).label("menu_count"),
-            )
-            .outerjoin(MenuItem, (Restaurant.id == MenuItem.restaurant_id))
-            .filter(Restaurant.country == user_country)
-            .group_by(Restaurant.id)
-            .order_by(Restaurant.name)
-            .all()
+        stmt = stmt.where(Restaurant.country == user_country)
+
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(Restaurant.country, Restaurant.name, Restaurant.id) > tuple_(*after)
         )
 
+    return db.session.execute(stmt).mappings().all()
+
 
 def get_restaurant_by_id(restaurant_id: int) -> Restaurant | None:
     """
@@ -55,7 +100,32 @@ def get_restaurant_by_id(restaurant_id: int) -> Restaurant | None:
     Returns:
         Restaurant instance or None
     """
-    return db.session.query(Restaurant).filter_by(id=restaurant_id).first()
+    return db.session.get(Restaurant, restaurant_id, options=raiseload_options())
+
+
+def get_restaurant_for_user(
+    restaurant_id: int, user_country: str | None = None
+) -> Restaurant | None:
+    """
+    Get a restaurant with its details by ID if the user may access it.
+
+    When a country is given, restaurants in other countries are filtered out
+    by the query itself, so they are reported as not found.
+
+    Args:
+        restaurant_id: Restaurant ID
+        user_country: Country the restaurant must be in (None for admins)
+
+    Returns:
+        Restaurant instance or None
+    """
+    if user_country is None:
+        stmt, params = _RESTAURANT_DETAILS_STMT, {"restaurant_id": restaurant_id}
+    else:
+        stmt = _RESTAURANT_DETAILS_FOR_COUNTRY_STMT
+        params = {"restaurant_id": restaurant_id, "country": user_country}
+
+    return db.session.execute(with_raiseload(stmt), params).scalar_one_or_none()
 
 
 def get_menu_items_for_restaurant(restaurant_id: int) -> list[MenuItem]:
@@ -69,8 +139,7 @@ def get_menu_items_for_restaurant(restaurant_id: int) -> list[MenuItem]:
         List of MenuItem instances
     """
     return (
-        db.session.query(MenuItem)
-        .filter_by(restaurant_id=restaurant_id)
-        .order_by(MenuItem.name)
+        db.session.execute(_MENU_ITEMS_STMT, {"restaurant_id": restaurant_id})
+        .scalars()
         .all()
     )
@@ -1,45 +1,37 @@
-from typing import Any
+from sqlalchemy import RowMapping
 
-from foodie.models import Restaurant
 
-
-def prepare_restaurant_for_template(
-    restaurant: Restaurant, menu_count: int = 0
-) -> dict[str, Any]:
+def encode_restaurant_cursor(restaurant: RowMapping) -> str:
     """
-    Prepare restaurant data for template rendering.
+    Encode the position of a restaurant in the restaurant list as a page cursor.
 
     Args:
-        restaurant: Restaurant instance
-        menu_count: Number of menu items
+        restaurant: Row mapping of the last restaurant on the current page
 
     Returns:
-        Dictionary with restaurant data formatted for template
+        Cursor string for the next page
     """
-    return {
-        "id": restaurant.id,
-        "name": restaurant.name,
-        "description": restaurant.description,
-        "country": restaurant.country,
-        "address": restaurant.address,
-        "phone": restaurant.phone,
-        "menu_count": menu_count,
-    }
-
-
-def prepare_restaurants_for_template(
-    restaurants: list[tuple[Restaurant, int]],
-) -> list[dict[str, Any]]:
+    return f"{restaurant['country']}_{restaurant['name']}_{restaurant['id']}"
+
+
+def decode_restaurant_cursor(cursor: str | None) -> tuple[str, str, int] | None:
     """
-    Prepare a list of restaurants for template rendering.
+    Decode a page cursor produced by encode_restaurant_cursor.
+
+    Countries never contain an underscore, so the name may.
 
     Args:
-        restaurants: List of tuples (restaurant, menu_count)
+        cursor: Cursor string from the request, if any
 
     Returns:
-        List of dictionaries with restaurant data formatted for template
+        Tuple (country, name, id), or None if the cursor is missing or invalid
     """
-    restaurant_list = []
-    for restaurant, menu_count in restaurants:
-        restaurant_list.append(prepare_restaurant_for_template(restaurant, menu_count))
-    return restaurant_list
+    if not cursor:
+        return None
+
+    country, _, rest = cursor.partition("_")
+    name, _, restaurant_id = rest.rpartition("_")
+    try:
+        return country, name, int(restaurant_id)
+    except ValueError:
+        return None
@@ -0,0 +1,85 @@
+"""
+Process-local caches shared by the blueprints.
+
+Each worker process keeps its own copy, so invalidating only reaches the
+current process and the TTL bounds how stale the other processes can be.
+"""
+
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Seconds the dashboard stats and recent orders are reused before reloading
+DASHBOARD_CACHE_TTL = 15.0
+
+# Seconds the active payment methods are reused before reloading
+PAYMENT_METHODS_CACHE_TTL = 60.0
+
+_dashboard_cache: tuple[float, object] | None = None
+
+_payment_methods_cache: tuple[float, object] | None = None
+
+
+def get_cached_dashboard_data(load: Callable[[], T]) -> T:
+    """
+    Get the admin dashboard data, reusing a recent result.
+
+    The result is cached for DASHBOARD_CACHE_TTL seconds and dropped early by
+    invalidate_dashboard_cache() when orders change.
+
+    Args:
+        load: Function that loads the dashboard data when not cached
+
+    Returns:
+        Dashboard data returned by load
+    """
+    global _dashboard_cache
+
+    cached = _dashboard_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    data = load()
+    _dashboard_cache = (time.monotonic() + DASHBOARD_CACHE_TTL, data)
+    return data
+
+
+def invalidate_dashboard_cache() -> None:
+    """Drop the cached dashboard data so the next request reloads it."""
+    global _dashboard_cache
+
+    _dashboard_cache = None
+
+
+def get_cached_payment_methods(load: Callable[[], T]) -> T:
+    """
+    Get the active payment methods, reusing a recent result.
+
+    Payment methods rarely change, so the result is cached for
+    PAYMENT_METHODS_CACHE_TTL seconds and dropped early by
+    invalidate_payment_methods_cache() when a payment method is changed.
+
+    Args:
+        load: Function that loads the payment methods when not cached
+
+    Returns:
+        Payment methods returned by load
+    """
+    global _payment_methods_cache
+
+    cached = _payment_methods_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    methods = load()
+    _payment_methods_cache = (time.monotonic() + PAYMENT_METHODS_CACHE_TTL, methods)
+    return methods
+
+
+def invalidate_payment_methods_cache() -> None:
+    """Drop the cached active payment methods so the next request reloads them."""
+    global _payment_methods_cache
+
+    _payment_methods_cache = None
@@ -1,5 +1,11 @@
-from sqlalchemy.orm import DeclarativeBase
+import sqlite3
+
+import click
+import flask
 import flask_sqlalchemy
+from sqlalchemy import Engine, Select, StatementLambdaElement, event
+from sqlalchemy.orm import DeclarativeBase, raiseload
+from sqlalchemy.orm.interfaces import ORMOption
 
 
 class Base(DeclarativeBase):
@@ -9,3 +15,95 @@ class Base(DeclarativeBase):
 
 
 db = flask_sqlalchemy.SQLAlchemy(model_class=Base)
+
+# Applied to every new SQLite connection. WAL lets reads proceed while a
+# commit is being written, and NORMAL sync is safe in WAL mode.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure SQLite connections for concurrent reads and writes."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def init_db() -> None:
+    """
+    Create any missing database tables and indexes.
+
+    Indexes are checked separately so ones added to existing tables are
+    created too.
+
+    Requires flask app context.
+    """
+    db.create_all()
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+
+
+@click.command("init-db")
+def init_db_command() -> None:
+    init_db()
+    click.echo("Initialized the database.")
+
+
+def init_init_db_command(app: flask.Flask) -> None:
+    """Register the init-db command with the Flask app."""
+
+    app.cli.add_command(init_db_command)
+
+
+def raiseload_options() -> list[ORMOption]:
+    """
+    Get loader options that make any unplanned lazy load raise an error.
+
+    Enabled by the RAISELOAD_ENABLED config value, which defaults to on in
+    debug and testing mode so missing eager loads are caught in development.
+
+    Requires flask app context.
+
+    Returns:
+        List of loader options to pass to a query's options()
+    """
+    app = flask.current_app
+    if app.config.get("RAISELOAD_ENABLED", app.debug or app.testing):
+        return [raiseload("*")]
+    return []
+
+
+def with_raiseload(
+    stmt: Select | StatementLambdaElement,
+) -> Select | StatementLambdaElement:
+    """
+    Extend a prebuilt statement with the options from raiseload_options().
+
+    When raiseload is disabled the statement is returned unchanged, so module
+    level statements are reused as-is.
+
+    Requires flask app context.
+
+    Args:
+        stmt: Select or statement built with sqlalchemy.lambda_stmt
+
+    Returns:
+        The statement, with raiseload("*") applied when enabled
+    """
+    if not raiseload_options():
+        return stmt
+    if isinstance(stmt, StatementLambdaElement):
+        stmt += lambda s: s.options(raiseload("*"))
+        return stmt
+    return stmt.options(raiseload("*"))
@@ -1,6 +1,7 @@
 import datetime
 
 from sqlalchemy import (
+    Boolean,
     Column,
     Integer,
     String,
@@ -8,8 +9,11 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     CheckConstraint,
+    Index,
+    event,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import deferred, relationship
 
 from foodie.db import db
 
@@ -31,8 +35,6 @@ class User(db.Model):
     )
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
 
-    orders = relationship("Order", back_populates="user")
-
     def __repr__(self):
         return f"<User {self.username} ({self.role}, {self.country})>"
 
@@ -42,16 +44,23 @@ class Restaurant(db.Model):
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
-    description = Column(String)
+    # Only shown on the restaurant page, so not loaded unless asked for
+    description = deferred(Column(String), group="details")
     country = Column(
         String, CheckConstraint("country IN ('India', 'America')"), nullable=False
     )
-    address = Column(String)
-    phone = Column(String)
+    address = deferred(Column(String), group="details")
+    phone = deferred(Column(String), group="details")
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
 
-    menu_items = relationship("MenuItem", back_populates="restaurant")
-    orders = relationship("Order", back_populates="restaurant")
+    __table_args__ = (
+        # Restaurants listed by name within a country
+        Index("ix_restaurant_country_name", country, name),
+    )
+
+    menu_items = relationship(
+        "MenuItem", back_populates="restaurant", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
         return f"<Restaurant {self.name} ({self.country})>"
@@ -67,8 +76,12 @@ class MenuItem(db.Model):
     price = Column(Float, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
 
+    __table_args__ = (
+        # Menu of a restaurant listed by name, and menu item counts
+        Index("ix_menu_item_restaurant_id_name", restaurant_id, name),
+    )
+
     restaurant = relationship("Restaurant", back_populates="menu_items")
-    order_items = relationship("OrderItem", back_populates="menu_item")
 
     def __repr__(self):
         return f"<MenuItem {self.name} (${self.price})>"
@@ -78,12 +91,15 @@ class PaymentMethod(db.Model):
     __tablename__ = "payment_method"
 
     id = Column(Integer, primary_key=True)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, unique=True, index=True)
     description = Column(String)
-    is_active = Column(Integer, nullable=False, default=1)
+    is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
 
-    orders = relationship("Order", back_populates="payment_method")
+    __table_args__ = (
+        # Active payment methods listed by name at checkout
+        Index("ix_payment_method_active_name", is_active, name),
+    )
 
     def __repr__(self):
         return f"<PaymentMethod {self.name}>"
@@ -103,16 +119,30 @@ class Order(db.Model):
         default="DRAFT",
     )
     total_amount = Column(Float, nullable=False, default=0.0)
-    notes = Column(String)
+    notes = deferred(Column(String))
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
     placed_at = Column(DateTime)
     cancelled_at = Column(DateTime)
 
-    user = relationship("User", back_populates="orders")
-    restaurant = relationship("Restaurant", back_populates="orders")
-    payment_method = relationship("PaymentMethod", back_populates="orders")
+    __table_args__ = (
+        # Recent orders on the admin dashboard
+        Index("ix_order_created_at", created_at.desc()),
+        # Placed order count and revenue totals, covered by the index
+        Index("ix_order_status_total_amount", status, total_amount),
+        # Existing draft lookup when starting an order
+        Index("ix_order_user_id_restaurant_id_status", user_id, restaurant_id, status),
+        # Orders of a restaurant, used when filtering orders by country
+        Index("ix_order_restaurant_id", restaurant_id),
+    )
+
+    user = relationship("User")
+    restaurant = relationship("Restaurant")
+    payment_method = relationship("PaymentMethod")
     order_items = relationship(
-        "OrderItem", back_populates="order", cascade="all, delete-orphan"
+        "OrderItem",
+        back_populates="order",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     def __repr__(self):
@@ -128,11 +158,127 @@ class OrderItem(db.Model):
     quantity = Column(Integer, nullable=False, default=1)
     unit_price = Column(Float, nullable=False)
     subtotal = Column(Float, nullable=False)
-    notes = Column(String)
+    notes = deferred(Column(String))
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
 
     order = relationship("Order", back_populates="order_items")
-    menu_item = relationship("MenuItem", back_populates="order_items")
+    menu_item = relationship("MenuItem")
+
+    __table_args__ = (
+        # One row per menu item in an order, so adding an item can upsert
+        Index(
+            "ix_order_item_order_id_menu_item_id",
+            order_id,
+            menu_item_id,
+            unique=True,
+        ),
+    )
 
     def __repr__(self):
         return f"<OrderItem {self.quantity}x {self.unit_price} = ${self.subtotal}>"
+
+
+class Counter(db.Model):
+    """Row counts for tables that are counted often, maintained by triggers."""
+
+    __tablename__ = "counter"
+
+    table_name = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<Counter {self.table_name}={self.value}>"
+
+
+COUNTED_TABLES = ("user", "restaurant", "order")
+
+
+def _trigger_exists(connection: Connection, name: str) -> bool:
+    """
+    Check whether a trigger exists in the SQLite database.
+
+    Args:
+        connection: Database connection
+        name: Trigger name
+
+    Returns:
+        True if the trigger exists, False otherwise
+    """
+    return (
+        connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+            (name,),
+        ).first()
+        is not None
+    )
+
+
+@event.listens_for(db.metadata, "after_create")
+def create_counter_triggers(target, connection: Connection, **kw) -> None:
+    """
+    Create the triggers that keep the counter table in sync.
+
+    Runs after create_all. A table is only recounted when its triggers are
+    first created, so existing databases start with correct values without
+    scanning every table on each run.
+    """
+    for table_name in COUNTED_TABLES:
+        if _trigger_exists(connection, f"counter_{table_name}_insert"):
+            continue
+
+        connection.exec_driver_sql(
+            f"INSERT OR REPLACE INTO counter (table_name, value) "
+            f"SELECT '{table_name}', COUNT(*) FROM \"{table_name}\""
+        )
+        for action, delta in (("INSERT", "+ 1"), ("DELETE", "- 1")):
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS counter_{table_name}_{action.lower()} "
+                f'AFTER {action} ON "{table_name}" BEGIN '
+                f"UPDATE counter SET value = value {delta} "
+                f"WHERE table_name = '{table_name}'; END"
+            )
+
+
+# Keep order.total_amount equal to the sum of its items' subtotals
+ORDER_TOTAL_TRIGGERS = {
+    "insert": (
+        'UPDATE "order" SET total_amount = ROUND(total_amount + NEW.subtotal, 2) '
+        "WHERE id = NEW.order_id"
+    ),
+    "update": (
+        'UPDATE "order" '
+        "SET total_amount = ROUND(total_amount + NEW.subtotal - OLD.subtotal, 2) "
+        "WHERE id = NEW.order_id"
+    ),
+    "delete": (
+        'UPDATE "order" SET total_amount = ROUND(total_amount - OLD.subtotal, 2) '
+        "WHERE id = OLD.order_id"
+    ),
+}
+
+
+@event.listens_for(db.metadata, "after_create")
+def create_order_total_triggers(target, connection: Connection, **kw) -> None:
+    """
+    Create the triggers that keep order totals in sync with their items.
+
+    Runs after create_all. Every order's total is only recomputed when the
+    triggers are first created, so existing databases start with correct
+    values without rewriting every order on each run.
+    """
+    if all(
+        _trigger_exists(connection, f"order_total_{action}")
+        for action in ORDER_TOTAL_TRIGGERS
+    ):
+        return
+
+    connection.exec_driver_sql(
+        'UPDATE "order" SET total_amount = ROUND(('
+        "SELECT COALESCE(SUM(subtotal), 0) FROM order_item "
+        'WHERE order_item.order_id = "order".id), 2)'
+    )
+    for action, statement in ORDER_TOTAL_TRIGGERS.items():
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS order_total_{action} "
+            f"AFTER {action.upper()} ON order_item BEGIN {statement}; END"
+        )
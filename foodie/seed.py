@@ -4,106 +4,180 @@ Run with: uv run flask --app foodie seed-db
 """
 
 import click
+import functools
 import json
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
+from sqlalchemy import insert
 from werkzeug.security import generate_password_hash
 
 import flask
 
-from foodie.db import db
+from foodie.db import db, init_db
 from foodie.models import User, Restaurant, MenuItem, PaymentMethod
 
+# Password hash method used for seeded users when SEED_FAST_HASH is set.
+# check_password_hash reads the method from the stored hash, so logins work
+# the same either way.
+FAST_PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
 
-def load_seed_data() -> dict[str, Any]:
-    seed_file = pathlib.Path(__file__).parent.parent / "seed_data.json"
-    with seed_file.open() as f:
-        return json.load(f)
+# Above this many distinct passwords, they are hashed across CPU cores
+PARALLEL_HASH_THRESHOLD = 16
 
+# Insert statements are built once at import, so reseeding reuses their
+# cached compiled form
 
-def seed_db() -> None:
-    """Seed the database with initial data from JSON file."""
+_PAYMENT_METHOD_INSERT_STMT = insert(PaymentMethod)
 
-    app = flask.current_app
+_USER_INSERT_STMT = insert(User)
 
-    with app.app_context():
-        data = load_seed_data()
-        create_payment_methods(data.get("payment_methods", []))
-        create_users(data["users"])
-        create_restaurants(data["restaurants"])
+_RESTAURANT_INSERT_STMT = insert(Restaurant).returning(
+    Restaurant.id, sort_by_parameter_order=True
+)
 
+_MENU_ITEM_INSERT_STMT = insert(MenuItem)
 
-def create_payment_methods(payment_methods_data: list[dict[str, Any]]) -> None:
-    """Create payment methods from JSON data."""
 
-    payment_methods = []
-    for method_data in payment_methods_data:
-        payment_method = PaymentMethod(
-            name=method_data["name"],
-            description=method_data.get("description", ""),
-            is_active=method_data.get("is_active", 1),
-        )
-        payment_methods.append(payment_method)
+def load_seed_data() -> dict[str, Any]:
+    seed_file = pathlib.Path(__file__).parent.parent / "seed_data.json"
+    return json.loads(seed_file.read_bytes())
 
-    db.session.add_all(payment_methods)
-    db.session.commit()
-    click.echo(f"Created {len(payment_methods)} payment methods.")
 
+def seed_db() -> dict[str, int]:
+    """
+    Seed the database with initial data from JSON file.
 
-def create_users(users_data: list[dict[str, Any]]) -> None:
-    """Create users from JSON data."""
+    Returns:
+        Number of rows created, keyed by kind of record
+    """
+
+    app = flask.current_app
+
+    with app.app_context():
+        init_db()
+        data = load_seed_data()
+
+        # Seed in one transaction so the data is committed, and synced to
+        # disk, once
+        with db.session.begin():
+            payment_methods = create_payment_methods(data.get("payment_methods", []))
+            users = create_users(data["users"])
+
+            # Building the menu item indexes once after the load is cheaper
+            # than updating them for every inserted row
+            connection = db.session.connection()
+            for index in MenuItem.__table__.indexes:
+                index.drop(connection, checkfirst=True)
+            restaurants, menu_items = create_restaurants(data["restaurants"])
+            for index in MenuItem.__table__.indexes:
+                index.create(connection)
+
+    return {
+        "payment methods": payment_methods,
+        "users": users,
+        "restaurants": restaurants,
+        "menu items": menu_items,
+    }
+
+
+def create_payment_methods(payment_methods_data: list[dict[str, Any]]) -> int:
+    """Create payment methods from JSON data and return how many."""
+
+    payment_methods = [
+        {
+            "name": method_data["name"],
+            "description": method_data.get("description", ""),
+            "is_active": bool(method_data.get("is_active", True)),
+        }
+        for method_data in payment_methods_data
+    ]
+
+    if payment_methods:
+        db.session.execute(_PAYMENT_METHOD_INSERT_STMT, payment_methods)
+    return len(payment_methods)
+
+
+def create_users(users_data: list[dict[str, Any]]) -> int:
+    """Create users from JSON data and return how many."""
+
+    hash_options = {}
+    if flask.current_app.config.get("SEED_FAST_HASH"):
+        hash_options["method"] = FAST_PASSWORD_HASH_METHOD
+    hash_password = functools.partial(generate_password_hash, **hash_options)
+
+    # Hashing is deliberately slow, and seed users mostly share a password,
+    # so each distinct password is hashed once
+    passwords = list(dict.fromkeys(user_data["password"] for user_data in users_data))
+    if len(passwords) > PARALLEL_HASH_THRESHOLD:
+        with ProcessPoolExecutor() as pool:
+            password_hashes = dict(zip(passwords, pool.map(hash_password, passwords)))
+    else:
+        password_hashes = {password: hash_password(password) for password in passwords}
 
     users = []
     for user_data in users_data:
-        user = User(
-            username=user_data["username"],
-            password=generate_password_hash(user_data["password"]),
-            full_name=user_data["full_name"],
-            role=user_data["role"],
-            country=user_data["country"],
+        users.append(
+            {
+                "username": user_data["username"],
+                "password": password_hashes[user_data["password"]],
+                "full_name": user_data["full_name"],
+                "role": user_data["role"],
+                "country": user_data["country"],
+            }
         )
-        users.append(user)
 
-    db.session.add_all(users)
-    db.session.commit()
-    click.echo(f"Created {len(users)} users.")
+    if users:
+        db.session.execute(_USER_INSERT_STMT, users)
+    return len(users)
 
 
-def create_restaurants(restaurants_data: list[dict[str, Any]]) -> None:
-    """Create restaurants and menu items from JSON data."""
+def create_restaurants(restaurants_data: list[dict[str, Any]]) -> tuple[int, int]:
+    """
+    Create restaurants and menu items from JSON data.
 
-    for restaurant_data in restaurants_data:
-        restaurant = Restaurant(
-            name=restaurant_data["name"],
-            description=restaurant_data["description"],
-            country=restaurant_data["country"],
-            address=restaurant_data["address"],
-            phone=restaurant_data["phone"],
-        )
-        db.session.add(restaurant)
-        # Flush the session to get the restaurant ID before creating menu items
-        db.session.flush()
+    Returns:
+        Tuple (restaurants created, menu items created)
+    """
+
+    restaurants = [
+        {
+            "name": restaurant_data["name"],
+            "description": restaurant_data["description"],
+            "country": restaurant_data["country"],
+            "address": restaurant_data["address"],
+            "phone": restaurant_data["phone"],
+        }
+        for restaurant_data in restaurants_data
+    ]
+    menu_items = []
+
+    if restaurants:
+        # RETURNING in parameter order pairs each new ID with its restaurant
+        restaurant_ids = db.session.scalars(_RESTAURANT_INSERT_STMT, restaurants).all()
 
-        menu_items = []
-        for item_data in restaurant_data.get("menu_items", []):
-            menu_item = MenuItem(
-                restaurant_id=restaurant.id,
-                name=item_data["name"],
-                description=item_data["description"],
-                price=item_data["price"],
-            )
-            menu_items.append(menu_item)
+        menu_items = [
+            {
+                "restaurant_id": restaurant_id,
+                "name": item_data["name"],
+                "description": item_data["description"],
+                "price": item_data["price"],
+            }
+            for restaurant_id, restaurant_data in zip(restaurant_ids, restaurants_data)
+            for item_data in restaurant_data.get("menu_items", [])
+        ]
 
-        db.session.add_all(menu_items)
+        if menu_items:
+            db.session.execute(_MENU_ITEM_INSERT_STMT, menu_items)
 
-    db.session.commit()
-    click.echo(f"Created {len(restaurants_data)} restaurants with menu items.")
+    return len(restaurants), len(menu_items)
 
 
 @click.command("seed-db")
 def seed_db_command() -> None:
-    seed_db()
-    click.echo("Database seeded successfully.")
+    counts = seed_db()
+    created = ", ".join(f"{count} {kind}" for kind, count in counts.items())
+    click.echo(f"Database seeded successfully: {created}.")
 
 
 def init_seed_db_command(app: flask.Flask) -> None: